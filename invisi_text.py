@@ -18,20 +18,56 @@ Decoding Example:
 """
 
 import argparse
-import sys
+import errno
+import itertools
 import os
+import re
+import sys
+import uuid
+from typing import Dict, Final, Iterator, List, Optional, Pattern, Tuple, Union
 
 # --- Configuration ---
 
 # We use two different zero-width characters to represent 0 and 1.
 # U+200B: Zero Width Space (ZWS)
-ZERO_BIT = u'\u200B'
+ZERO_BIT: Final[str] = u'\u200B'
 # U+200C: Zero Width Non-Joiner (ZWNJ)
-ONE_BIT = u'\u200C'
+ONE_BIT: Final[str] = u'\u200C'
 
 # We use a non-printable character as an End-of-Transmission (EOT) marker.
 # This tells the decoder when the secret message is complete.
-EOT_CHAR = u'\u0004'
+EOT_CHAR: Final[str] = u'\u0004'
+# The same marker as a byte value, for searching decoded bytes
+_EOT_BYTE: Final[int] = ord(EOT_CHAR)
+
+# Pre-compiled helpers for the decoder: the regex picks out only the
+# zero-width characters, and the table maps each of them to its bit.
+_ZW_RE: Final[Pattern[str]] = re.compile(f'[{ZERO_BIT}{ONE_BIT}]')
+_DECODE_TABLE: Final[Dict[int, str]] = str.maketrans({ZERO_BIT: '0', ONE_BIT: '1'})
+
+# The UTF-8 encoded zero-width character for each bit value, indexed by
+# the bit itself (0 or 1) so no comparison is needed to pick one.
+_BIT_CHARS: Final[Tuple[bytes, bytes]] = (ZERO_BIT.encode('utf-8'), ONE_BIT.encode('utf-8'))
+
+# Lookup table for the encoder: for every possible byte value, the UTF-8
+# encoded zero-width character for each of its 8 bits (MSB first). The
+# entries share the two bytes objects above, so nothing is allocated
+# per bit while encoding.
+_BYTE_TO_ZW: Final[List[Tuple[bytes, ...]]] = [
+    tuple(_BIT_CHARS[(byte >> (7 - i)) & 1] for i in range(8))
+    for byte in range(256)
+]
+
+# The same scan on raw UTF-8 bytes, so files can be decoded without first
+# turning them into a str. ZERO_BIT and ONE_BIT encode to E2 80 8B and
+# E2 80 8C: only the last byte differs, and it alone carries the bit.
+_ZW_BYTES_RE: Final[Pattern[bytes]] = re.compile(b'\xe2\x80[\x8b\x8c]')
+_BYTES_DECODE_TABLE: Final[bytes] = bytes.maketrans(b'\x8b\x8c', b'01')
+
+# Files are read and written in chunks of this many bytes, so memory use
+# stays bounded no matter how large the carrier or stego file is.
+# Deliberately not Final, so callers can tune it.
+CHUNK_SIZE: int = 1 << 16
 
 # --- Core Functions ---
 
@@ -39,6 +75,9 @@ def _message_to_binary(message: str) -> str:
     """
     Converts a UTF-8 string into its binary representation (a string of '0's and '1's).
     
+    Not used by the encoders, which map bytes straight to zero-width
+    characters; kept as a debugging aid for inspecting a message's bits.
+    
     Args:
         message: The string to convert.
     
@@ -48,14 +87,150 @@ def _message_to_binary(message: str) -> str:
     try:
         # Encode the message to bytes using UTF-8
         message_bytes = message.encode('utf-8')
-        
-        # Convert each byte into its 8-bit binary representation
-        # zfill(8) ensures each byte is represented by 8 bits
-        return ''.join(format(byte, '08b') for byte in message_bytes)
+        if not message_bytes:
+            return ""
+
+        # Treat the whole byte string as one big-endian integer and format
+        # it in a single call. Zero-padding to 8 bits per byte keeps any
+        # leading zero bits (MSB-first, same as format(byte, '08b')).
+        bit_count = len(message_bytes) * 8
+        return format(int.from_bytes(message_bytes, 'big'), f'0{bit_count}b')
     except Exception as e:
         print(f"Error converting message to binary: {e}", file=sys.stderr)
         return ""
 
+def _message_to_bytes(message: str) -> bytes:
+    """
+    Converts a string into the UTF-8 bytes that get hidden in the carrier.
+    
+    Args:
+        message: The string to convert.
+    
+    Returns:
+        The UTF-8 encoded message, or empty bytes if it cannot be encoded.
+    """
+    try:
+        return message.encode('utf-8')
+    except Exception as e:
+        print(f"Error encoding message to UTF-8: {e}", file=sys.stderr)
+        return b""
+
+def _iter_bit_bytes(message_bytes: bytes) -> Iterator[bytes]:
+    """
+    Yields the zero-width character for each bit of the message, lazily.
+    
+    Args:
+        message_bytes: The bytes to convert.
+    
+    Returns:
+        An iterator over the UTF-8 encoded ZERO_BIT/ONE_BIT characters,
+        8 per input byte, without building the whole bit stream.
+    """
+    # One table lookup per byte yields all 8 of its bit characters
+    return itertools.chain.from_iterable(map(_BYTE_TO_ZW.__getitem__, message_bytes))
+
+def _prepare_secret(secret_message: str) -> Optional[bytes]:
+    """
+    Checks a secret message and turns it into the bytes to hide.
+    
+    Args:
+        secret_message: The secret message to hide.
+    
+    Returns:
+        The UTF-8 encoded message with the EOT marker appended, or None
+        if it is empty or cannot be encoded (the error is reported).
+    """
+    if not secret_message:
+        print("Error: Secret message cannot be empty.", file=sys.stderr)
+        return None
+
+    # Append the EOT marker so the decoder knows when to stop
+    secret_bytes = _message_to_bytes(secret_message + EOT_CHAR)
+    
+    if not secret_bytes:
+        print("Error: Could not convert secret message to binary.", file=sys.stderr)
+        return None
+
+    return secret_bytes
+
+def _check_capacity(bit_count: int, capacity: int) -> bool:
+    """
+    Checks that the carrier has room for the message, reporting either way.
+    
+    Args:
+        bit_count: Number of bits to hide.
+        capacity: Number of bit-slots (spaces) in the carrier.
+    
+    Returns:
+        True if the message fits.
+    """
+    if bit_count > capacity:
+        print("Error: Carrier text is not long enough to hold the secret message.", file=sys.stderr)
+        print(f"    Carrier capacity (bits): {capacity}", file=sys.stderr)
+        print(f"    Secret message size (bits): {bit_count}", file=sys.stderr)
+        return False
+
+    print(f"Successfully converted secret message to {bit_count}-bit stream.")
+    print(f"Carrier text has {capacity} bit-slots available.")
+    return True
+
+def _embed(carrier_bytes: bytes, secret_bytes: bytes) -> bytes:
+    """
+    Hides the bits of secret_bytes in the carrier, which must have room.
+    
+    Args:
+        carrier_bytes: The UTF-8 encoded carrier text.
+        secret_bytes: The bytes to hide, EOT marker included.
+    
+    Returns:
+        The UTF-8 encoded carrier text with the bits embedded.
+    """
+    # Write the output into one buffer. Each of the first bit_count words
+    # is followed by a space, its bit character and another space. The
+    # zero-width characters end up right after the space, before the
+    # next word. Words are found with find() rather than splitting the
+    # whole carrier into a list; slices of the view are zero-copy.
+    carrier_view = memoryview(carrier_bytes)
+    stego_bytes = bytearray()
+    word_start = 0
+    for bit_char in _iter_bit_bytes(secret_bytes):
+        word_end = carrier_bytes.find(b' ', word_start) + 1
+        stego_bytes += carrier_view[word_start:word_end]
+        stego_bytes += bit_char
+        stego_bytes += b' '
+        word_start = word_end
+
+    # The remaining words are copied over untouched
+    stego_bytes += carrier_view[word_start:]
+    
+    return bytes(stego_bytes)
+
+def _pack_bits(bit_stream: Union[str, bytes]) -> Tuple[bytes, bool]:
+    """
+    Packs the complete bytes of a '0'/'1' stream, stopping at the EOT marker.
+    
+    Args:
+        bit_stream: The bits to pack, MSB first, as a str or ASCII bytes.
+    
+    Returns:
+        The bytes before the EOT marker (all complete bytes if there is
+        none; any incomplete byte at the end is dropped), and whether the
+        EOT marker was found.
+    """
+    byte_count = len(bit_stream) // 8
+    if not byte_count:
+        return b'', False
+
+    # Parse all complete bytes as one big integer and turn it back
+    # into bytes in a single call, rather than int(..., 2) per byte
+    message_bytes = int(bit_stream[:byte_count * 8], 2).to_bytes(byte_count, 'big')
+
+    # Cut the message at the EOT marker, if there is one
+    eot_index = message_bytes.find(_EOT_BYTE)
+    if eot_index == -1:
+        return message_bytes, False
+    return message_bytes[:eot_index], True
+
 def _binary_to_message(binary_stream: str) -> str:
     """
     Converts a binary string ('0's and '1's) back into a UTF-8 string.
@@ -67,31 +242,48 @@ def _binary_to_message(binary_stream: str) -> str:
         The decoded UTF-8 string.
     """
     try:
-        byte_list = []
-        # Process the stream in 8-bit (1-byte) chunks
-        for i in range(0, len(binary_stream), 8):
-            byte_str = binary_stream[i:i+8]
-            
-            # Stop if we have an incomplete byte at the end
-            if len(byte_str) < 8:
-                break
-                
-            # Convert the binary byte string to an integer
-            byte_int = int(byte_str, 2)
-            
-            # Check for the EOT marker
-            if byte_int == ord(EOT_CHAR):
-                break
-                
-            byte_list.append(byte_int)
-        
-        # Convert the list of byte integers into a bytes object
-        # and then decode it back to a string
-        return bytes(byte_list).decode('utf-8', 'ignore')
+        message_bytes, _ = _pack_bits(binary_stream)
+
+        # Decode the bytes back to a string
+        return message_bytes.decode('utf-8', 'ignore')
     except Exception as e:
         print(f"Error converting binary to message: {e}", file=sys.stderr)
         return ""
 
+def _scan_bits(stego_bytes: bytes) -> bytes:
+    """
+    Finds the hidden bits in a buffer of UTF-8 encoded text.
+    
+    Args:
+        stego_bytes: The UTF-8 bytes to scan.
+    
+    Returns:
+        ASCII bytes of '0's and '1's, one per zero-width character found.
+    """
+    # Keep only the 3-byte zero-width sequences, then take the last byte
+    # of each one and map it to '0'/'1'.
+    hidden_bytes = b''.join(_ZW_BYTES_RE.findall(stego_bytes))
+    return hidden_bytes[2::3].translate(_BYTES_DECODE_TABLE)
+
+def _decode_bit_stream(bit_stream: str) -> str:
+    """
+    Converts a scanned bit stream into the hidden message, reporting progress.
+    
+    Args:
+        bit_stream: The '0'/'1' string recovered from the stego text.
+    
+    Returns:
+        The extracted secret message.
+    """
+    if not bit_stream:
+        print("No hidden message found.", file=sys.stderr)
+        return ""
+        
+    print(f"Found {len(bit_stream)}-bit hidden stream. Decoding...")
+    
+    # Convert the bit stream back to a message
+    return _binary_to_message(bit_stream)
+
 # --- Main API ---
 
 def encode(carrier_text: str, secret_message: str) -> str:
@@ -106,54 +298,77 @@ def encode(carrier_text: str, secret_message: str) -> str:
         A string of the carrier text with the secret message embedded,
         or an empty string if encoding failed.
     """
-    if not carrier_text:
-        print("Error: Carrier text cannot be empty.", file=sys.stderr)
-        return ""
-        
-    if not secret_message:
-        print("Error: Secret message cannot be empty.", file=sys.stderr)
-        return ""
+    return encode_bytes(carrier_text, secret_message).decode('utf-8')
 
-    # Append the EOT marker so the decoder knows when to stop
-    secret_with_eot = secret_message + EOT_CHAR
-    secret_binary = _message_to_binary(secret_with_eot)
+def encode_bytes(carrier_text: str, secret_message: str) -> bytes:
+    """
+    Embeds a secret message into a carrier text, returning UTF-8 bytes.
     
-    if not secret_binary:
-        print("Error: Could not convert secret message to binary.", file=sys.stderr)
-        return ""
+    This is the same as encode(), but builds the result directly in a
+    single byte buffer, ready to be written to a file in binary mode.
+    
+    Args:
+        carrier_text: The public text to hide the message in.
+        secret_message: The secret message to hide.
+        
+    Returns:
+        The UTF-8 encoded carrier text with the secret message embedded,
+        or empty bytes if encoding failed.
+    """
+    return Encoder(carrier_text).encode(secret_message)
 
-    # We embed one bit of the secret message *between* each word
-    # of the carrier text.
-    carrier_words = carrier_text.split(' ')
+class Encoder:
+    """
+    Hides secret messages in a fixed carrier text.
     
-    # Check if the carrier text is long enough to hold the message
-    # We need len(words) - 1 spaces to hide the bits.
-    if len(secret_binary) > len(carrier_words) - 1:
-        print("Error: Carrier text is not long enough to hold the secret message.", file=sys.stderr)
-        print(f"    Carrier capacity (bits): {len(carrier_words) - 1}", file=sys.stderr)
-        print(f"    Secret message size (bits): {len(secret_binary)}", file=sys.stderr)
-        return ""
+    Useful when many secrets are embedded in the same carrier: the carrier
+    is encoded and measured once up front, so each call to encode() only
+    does work proportional to the secret, plus one copy of the untouched
+    tail. encode_bytes() is a one-shot Encoder.
+    """
 
-    print(f"Successfully converted secret message to {len(secret_binary)}-bit stream.")
-    print(f"Carrier text has {len(carrier_words) - 1} bit-slots available.")
+    def __init__(self, carrier_text: str) -> None:
+        """
+        Args:
+            carrier_text: The public text to hide messages in.
+        """
+        # None if the carrier could not be encoded (already reported)
+        self._carrier_bytes: Optional[bytes] = None
+        try:
+            self._carrier_bytes = carrier_text.encode('utf-8')
+        except UnicodeEncodeError as e:
+            print(f"Error encoding carrier text to UTF-8: {e}", file=sys.stderr)
 
-    # Build the output word by word
-    output_words = []
-    
-    for i, word in enumerate(carrier_words):
-        output_words.append(word)
+        # We embed one bit of the secret message *between* each word
+        # of the carrier text, i.e. at each space.
+        self.capacity: int = self._carrier_bytes.count(b' ') if self._carrier_bytes else 0
+
+    def encode(self, secret_message: str) -> bytes:
+        """
+        Embeds a secret message into the carrier text.
         
-        # If we still have bits to hide, add one
-        if i < len(secret_binary):
-            bit = secret_binary[i]
-            bit_char = ONE_BIT if bit == '1' else ZERO_BIT
-            output_words.append(bit_char)
+        Args:
+            secret_message: The secret message to hide.
+            
+        Returns:
+            The UTF-8 encoded carrier text with the secret message embedded,
+            or empty bytes if encoding failed.
+        """
+        if self._carrier_bytes is None:
+            return b""
 
-    # Re-join the text with spaces. The zero-width characters
-    # will be placed right after the space, before the next word.
-    stego_text = ' '.join(output_words)
-    
-    return stego_text
+        if not self._carrier_bytes:
+            print("Error: Carrier text cannot be empty.", file=sys.stderr)
+            return b""
+
+        secret_bytes = _prepare_secret(secret_message)
+        if secret_bytes is None:
+            return b""
+
+        if not _check_capacity(len(secret_bytes) * 8, self.capacity):
+            return b""
+
+        return _embed(self._carrier_bytes, secret_bytes)
 
 def decode(stego_text: str) -> str:
     """
@@ -170,27 +385,233 @@ def decode(stego_text: str) -> str:
         return ""
 
     print("Scanning text for hidden bits...")
-    bit_stream = ""
-    
-    # Scan every character in the text
-    for char in stego_text:
-        if char == ZERO_BIT:
-            bit_stream += '0'
-        elif char == ONE_BIT:
-            bit_stream += '1'
-            
-    if not bit_stream:
-        print("No hidden message found.", file=sys.stderr)
+
+    # Pull out every zero-width character, then map them to '0'/'1'.
+    # Both steps run in C, so normal characters cost almost nothing.
+    hidden_chars = ''.join(_ZW_RE.findall(stego_text))
+    bit_stream = hidden_chars.translate(_DECODE_TABLE)
+
+    return _decode_bit_stream(bit_stream)
+
+def decode_bytes(stego_bytes: bytes) -> str:
+    """
+    Extracts a secret message from UTF-8 encoded steganographic text.
+    
+    This is the same as decode(), but works on the raw bytes directly,
+    which avoids decoding a large file into a str just to scan it.
+    
+    Args:
+        stego_bytes: The UTF-8 bytes containing the hidden message.
+    
+    Returns:
+        The extracted secret message.
+    """
+    if not stego_bytes:
+        print("Error: Steganographic text cannot be empty.", file=sys.stderr)
         return ""
+
+    print("Scanning text for hidden bits...")
+    return _decode_bit_stream(_scan_bits(stego_bytes).decode('ascii'))
+
+# --- Streaming API ---
+
+def encode_stream(carrier_path: str, secret_path: str, output_path: str) -> bool:
+    """
+    Embeds the secret message from one file into a carrier file.
+    
+    The carrier is streamed in CHUNK_SIZE pieces and the result is written
+    as it is produced, so the carrier never has to fit in memory. The
+    output is identical to encode_bytes() on the same inputs.
+    
+    Args:
+        carrier_path: Path to the carrier text file.
+        secret_path: Path to the file holding the secret message.
+        output_path: Path to write the steganographic text to.
         
-    print(f"Found {len(bit_stream)}-bit hidden stream. Decoding...")
+    Returns:
+        True if the message was embedded, False if encoding failed.
+    """
+    # Read the secret as text so invalid UTF-8 fails loudly here instead
+    # of producing a message that cannot be decoded later
+    with open(secret_path, 'r', encoding='utf-8') as f:
+        secret_message = f.read()
+
+    # First pass: measure the carrier's capacity without keeping it around
+    carrier_size = 0
+    capacity = 0
+    with open(carrier_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            carrier_size += len(chunk)
+            capacity += chunk.count(b' ')
+
+    if not carrier_size:
+        print("Error: Carrier text cannot be empty.", file=sys.stderr)
+        return False
+
+    secret_bytes = _prepare_secret(secret_message)
+    if secret_bytes is None:
+        return False
+
+    bit_count = len(secret_bytes) * 8
+    if not _check_capacity(bit_count, capacity):
+        return False
+
+    bit_chars = _iter_bit_bytes(secret_bytes)
+
+    # Write to a temporary file next to the output and move it into place
+    # at the end, so the output may safely be the carrier file itself.
+    # Symlinks are resolved first so a symlinked output is written
+    # through, as opening it for writing would, rather than replaced.
+    target_path = os.path.realpath(output_path)
+    try:
+        if os.path.isdir(target_path):
+            raise IsADirectoryError(errno.EISDIR, os.strerror(errno.EISDIR))
+        temp_fd, temp_path = _create_temp_output(target_path)
+    except OSError as e:
+        # Report the output path the user gave, not the temporary file
+        raise type(e)(e.errno, e.strerror, output_path) from e
+    try:
+        stego_size = _write_stego_stream(carrier_path, temp_fd, bit_chars, bit_count)
+        _copy_output_mode(target_path, temp_path)
+        os.replace(temp_path, target_path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+    # Verification, using the sizes we already have instead of stat()
+    print(f"Original size: {carrier_size} bytes")
+    print(f"Encoded size:  {stego_size} bytes (difference is the hidden data)")
+
+    return True
+
+def _write_stego_stream(carrier_path: str, output_fd: int, bit_chars: Iterator[bytes], bit_count: int) -> int:
+    """
+    Streams the carrier into an open output file, hiding the given bits.
     
-    # Convert the bit stream back to a message
-    return _binary_to_message(bit_stream)
+    Args:
+        carrier_path: Path to the carrier text file.
+        output_fd: File descriptor to write the steganographic text to.
+            It is closed before returning.
+        bit_chars: The UTF-8 encoded bit characters to hide.
+        bit_count: How many bit characters bit_chars yields.
+        
+    Returns:
+        The number of bytes written.
+    """
+    bits_left = bit_count
+
+    # The output is the carrier with a bit character and a space inserted
+    # after each of its first bit_count spaces, so each chunk can be
+    # walked with find() and written through without buffering words
+    with open(output_fd, 'wb') as dst, open(carrier_path, 'rb') as src:
+        for chunk in iter(lambda: src.read(CHUNK_SIZE), b''):
+            chunk_view = memoryview(chunk)
+            start = 0
+
+            # Same layout as _embed(): word, space, bit, space
+            while bits_left:
+                space = chunk.find(b' ', start)
+                if space == -1:
+                    break
+                dst.write(chunk_view[start:space + 1])
+                dst.write(next(bit_chars) + b' ')
+                bits_left -= 1
+                start = space + 1
+
+            # The rest of the chunk is copied through as-is
+            dst.write(chunk_view[start:])
+
+        return dst.tell()
+
+def _create_temp_output(target_path: str) -> Tuple[int, str]:
+    """
+    Creates a new, empty temporary file next to the output.
+    
+    Args:
+        target_path: Path the output will be moved to.
+    
+    Returns:
+        The open file descriptor and the path of the temporary file.
+    """
+    output_dir, output_name = os.path.split(target_path)
+    temp_path = os.path.join(output_dir, f'.{output_name}.{uuid.uuid4().hex}.tmp')
+    # Mode 0o666 lets the kernel apply the umask, as for any new file
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0)
+    return os.open(temp_path, flags, 0o666), temp_path
+
+def _copy_output_mode(target_path: str, temp_path: str) -> None:
+    """
+    Gives a temporary output file the permissions of the file it replaces.
+    
+    A new output keeps the umask-based mode it was created with.
+    
+    Args:
+        target_path: Path the output will be moved to.
+        temp_path: Path of the temporary output file.
+    """
+    try:
+        mode = os.stat(target_path).st_mode & 0o7777
+    except FileNotFoundError:
+        return
+    os.chmod(temp_path, mode)
+
+def decode_stream(stego_path: str) -> str:
+    """
+    Extracts a secret message from a steganographic text file.
+    
+    The file is scanned in CHUNK_SIZE pieces, and reading stops as soon
+    as the EOT marker has been found.
+    
+    Args:
+        stego_path: Path to the file containing the hidden message.
+    
+    Returns:
+        The extracted secret message.
+    """
+    bit_count = 0
+    message_bytes = bytearray()
+    # Bits left over after the last complete byte. These stay as ASCII
+    # bytes: int() parses them directly, so no str is ever built.
+    bit_stream = b''
+    # The last 2 bytes of the previous chunk, in case a zero-width
+    # sequence was split across the chunk boundary
+    tail = b''
+    is_empty = True
+
+    with open(stego_path, 'rb') as f:
+        print("Scanning text for hidden bits...")
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            is_empty = False
+            buffer = tail + chunk
+            tail = buffer[-2:]
+
+            new_bits = _scan_bits(buffer)
+            bit_count += len(new_bits)
+            bit_stream += new_bits
+
+            # Convert the complete bytes we have so far, and stop reading
+            # once the EOT marker shows up
+            new_bytes, found_eot = _pack_bits(bit_stream)
+            message_bytes += new_bytes
+            if found_eot:
+                break
+            bit_stream = bit_stream[len(new_bytes) * 8:]
+
+    if is_empty:
+        print("Error: Steganographic text cannot be empty.", file=sys.stderr)
+        return ""
+
+    if not bit_count:
+        print("No hidden message found.", file=sys.stderr)
+        return ""
+
+    print(f"Found {bit_count}-bit hidden stream. Decoding...")
+
+    return message_bytes.decode('utf-8', 'ignore')
 
 # --- Command-Line Interface ---
 
-def main():
+def main() -> None:
     """
     Main function to parse arguments and run the tool.
     """
@@ -244,35 +665,13 @@ def main():
         try:
             print("--- Running InvisiText Encoder ---")
             
-            # Read carrier file
-            if not os.path.exists(args.carrier):
-                raise FileNotFoundError(f"Carrier file not found: {args.carrier}")
-            with open(args.carrier, 'r', encoding='utf-8') as f:
-                carrier_text = f.read()
-            
-            # Read secret file
-            if not os.path.exists(args.secret):
-                raise FileNotFoundError(f"Secret file not found: {args.secret}")
-            with open(args.secret, 'r', encoding='utf-8') as f:
-                secret_message = f.read()
-                
-            # Perform encoding
-            stego_text = encode(carrier_text, secret_message)
-            
-            if stego_text:
-                # Write the output
-                with open(args.output, 'w', encoding='utf-8') as f:
-                    f.write(stego_text)
+            # Perform encoding, streaming the carrier into the output file.
+            # A missing input file surfaces as FileNotFoundError from open().
+            if encode_stream(args.carrier, args.secret, args.output):
                 print(f"Successfully encoded secret message into: {args.output}")
-                
-                # Verification
-                original_size = os.path.getsize(args.carrier)
-                stego_size = os.path.getsize(args.output)
-                print(f"Original size: {original_size} bytes")
-                print(f"Encoded size:  {stego_size} bytes (difference is the hidden data)")
 
         except FileNotFoundError as e:
-            print(f"Error: {e}", file=sys.stderr)
+            print(f"Error: File not found: {e.filename}", file=sys.stderr)
             sys.exit(1)
         except Exception as e:
             print(f"An unexpected error occurred during encoding: {e}", file=sys.stderr)
@@ -282,14 +681,9 @@ def main():
         try:
             print("--- Running InvisiText Decoder ---")
             
-            # Read steganographic file
-            if not os.path.exists(args.input):
-                raise FileNotFoundError(f"Input file not found: {args.input}")
-            with open(args.input, 'r', encoding='utf-8') as f:
-                stego_text = f.read()
-            
-            # Perform decoding
-            secret_message = decode(stego_text)
+            # Perform decoding, streaming the file in chunks.
+            # A missing input file surfaces as FileNotFoundError from open().
+            secret_message = decode_stream(args.input)
             
             if secret_message:
                 print("\n--- DECODED MESSAGE START ---")
@@ -299,7 +693,7 @@ def main():
                 print("Could not decode a message.")
                 
         except FileNotFoundError as e:
-            print(f"Error: {e}", file=sys.stderr)
+            print(f"Error: File not found: {e.filename}", file=sys.stderr)
             sys.exit(1)
         except Exception as e:
             print(f"An unexpected error occurred during decoding: {e}", file=sys.stderr)
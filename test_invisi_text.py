@@ -0,0 +1,196 @@
+"""
+Regression tests for InvisiText's streaming encoder and decoder.
+
+Run with:
+    python -m unittest test_invisi_text
+"""
+
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+
+import invisi_text
+
+CARRIER_TEXT = (
+    "This is a sample carrier file. It is a vessel, a container, a simple "
+    "collection of words that will be used for a higher purpose. "
+) * 40
+SECRETS = ["Hello", "héllo wörld \U0001F600", "x"]
+
+
+class StreamTests(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.addCleanup(setattr, invisi_text, 'CHUNK_SIZE', invisi_text.CHUNK_SIZE)
+
+        # The tool reports progress on stdout/stderr; keep test output clean
+        quiet = contextlib.ExitStack()
+        quiet.enter_context(contextlib.redirect_stdout(io.StringIO()))
+        quiet.enter_context(contextlib.redirect_stderr(io.StringIO()))
+        self.addCleanup(quiet.close)
+
+    def _write(self, name, text):
+        path = os.path.join(self._tmp.name, name)
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            f.write(text)
+        return path
+
+    def _write_bytes(self, name, data):
+        path = os.path.join(self._tmp.name, name)
+        with open(path, 'wb') as f:
+            f.write(data)
+        return path
+
+    def _read(self, path):
+        with open(path, 'rb') as f:
+            return f.read()
+
+    def test_stream_matches_in_memory_across_chunk_boundaries(self):
+        carriers = [CARRIER_TEXT, "é ü  ab " * 200]
+        for chunk_size in (1, 2, 3, 5, 64, 1 << 16):
+            invisi_text.CHUNK_SIZE = chunk_size
+            for carrier in carriers:
+                for secret in SECRETS:
+                    with self.subTest(chunk_size=chunk_size, carrier=carrier[:10], secret=secret):
+                        carrier_path = self._write('carrier.txt', carrier)
+                        secret_path = self._write('secret.txt', secret)
+                        output_path = os.path.join(self._tmp.name, 'output.txt')
+
+                        self.assertTrue(invisi_text.encode_stream(carrier_path, secret_path, output_path))
+                        self.assertEqual(self._read(output_path), invisi_text.encode_bytes(carrier, secret))
+                        self.assertEqual(invisi_text.decode_stream(output_path), secret)
+
+    def test_space_free_prefix_longer_than_chunk(self):
+        invisi_text.CHUNK_SIZE = 64
+        carrier = "word\n" * 1000 + "a " * 200
+        carrier_path = self._write('carrier.txt', carrier)
+        secret_path = self._write('secret.txt', "Hello")
+        output_path = os.path.join(self._tmp.name, 'output.txt')
+
+        self.assertTrue(invisi_text.encode_stream(carrier_path, secret_path, output_path))
+        self.assertEqual(self._read(output_path), invisi_text.encode_bytes(carrier, "Hello"))
+        self.assertEqual(invisi_text.decode_stream(output_path), "Hello")
+
+    def test_encode_in_place(self):
+        carrier_path = self._write('carrier.txt', CARRIER_TEXT)
+        secret_path = self._write('secret.txt', "Hello")
+
+        self.assertTrue(invisi_text.encode_stream(carrier_path, secret_path, carrier_path))
+        self.assertEqual(self._read(carrier_path), invisi_text.encode_bytes(CARRIER_TEXT, "Hello"))
+        self.assertEqual(invisi_text.decode_stream(carrier_path), "Hello")
+        # No temporary files are left behind
+        self.assertEqual(sorted(os.listdir(self._tmp.name)), ['carrier.txt', 'secret.txt'])
+
+    @unittest.skipUnless(hasattr(os, 'symlink') and os.name == 'posix', "needs POSIX symlinks and modes")
+    def test_output_symlink_is_written_through(self):
+        carrier_path = self._write('carrier.txt', CARRIER_TEXT)
+        secret_path = self._write('secret.txt', "Hello")
+        target_path = os.path.join(self._tmp.name, 'target.txt')
+        link_path = os.path.join(self._tmp.name, 'link.txt')
+        os.symlink(target_path, link_path)
+
+        self.assertTrue(invisi_text.encode_stream(carrier_path, secret_path, link_path))
+        self.assertTrue(os.path.islink(link_path))
+        self.assertEqual(self._read(target_path), invisi_text.encode_bytes(CARRIER_TEXT, "Hello"))
+        # A new output gets the usual umask-based mode
+        umask = os.umask(0o022)
+        os.umask(umask)
+        self.assertEqual(os.stat(target_path).st_mode & 0o777, 0o666 & ~umask)
+
+    def test_bad_output_path_is_named_in_error(self):
+        carrier_path = self._write('carrier.txt', CARRIER_TEXT)
+        secret_path = self._write('secret.txt', "Hello")
+
+        for output_path in (os.path.join(self._tmp.name, 'missing', 'output.txt'), self._tmp.name):
+            with self.assertRaises(OSError) as cm:
+                invisi_text.encode_stream(carrier_path, secret_path, output_path)
+            self.assertEqual(cm.exception.filename, output_path)
+
+    def test_carrier_too_short_leaves_output_alone(self):
+        carrier_path = self._write('carrier.txt', "too short")
+        secret_path = self._write('secret.txt', "Hello")
+        output_path = self._write('output.txt', "untouched")
+
+        self.assertFalse(invisi_text.encode_stream(carrier_path, secret_path, output_path))
+        self.assertEqual(self._read(output_path), b"untouched")
+
+    def test_invalid_utf8_secret_is_rejected(self):
+        carrier_path = self._write('carrier.txt', CARRIER_TEXT)
+        secret_path = self._write_bytes('secret.txt', b"\xff\xfe")
+        output_path = os.path.join(self._tmp.name, 'output.txt')
+
+        with self.assertRaises(UnicodeDecodeError):
+            invisi_text.encode_stream(carrier_path, secret_path, output_path)
+        self.assertFalse(os.path.exists(output_path))
+
+    def test_crlf_secret_decodes_with_plain_newlines(self):
+        carrier_path = self._write('carrier.txt', CARRIER_TEXT)
+        secret_path = self._write_bytes('secret.txt', b"line one\r\nline two")
+        output_path = os.path.join(self._tmp.name, 'output.txt')
+
+        self.assertTrue(invisi_text.encode_stream(carrier_path, secret_path, output_path))
+        self.assertEqual(invisi_text.decode_stream(output_path), "line one\nline two")
+
+
+class EncoderTests(unittest.TestCase):
+
+    def test_matches_encode_bytes_and_reports_status(self):
+        encoder = invisi_text.Encoder(CARRIER_TEXT)
+        for secret in SECRETS:
+            with self.subTest(secret=secret):
+                with contextlib.redirect_stdout(io.StringIO()) as out:
+                    stego_bytes = encoder.encode(secret)
+                with contextlib.redirect_stdout(io.StringIO()):
+                    self.assertEqual(stego_bytes, invisi_text.encode_bytes(CARRIER_TEXT, secret))
+                self.assertIn("bit-slots available", out.getvalue())
+
+    def test_unencodable_carrier_is_reported(self):
+        with contextlib.redirect_stderr(io.StringIO()) as err:
+            self.assertEqual(invisi_text.encode("a \udc80 b " * 100, "x"), "")
+        self.assertIn("Error encoding carrier text", err.getvalue())
+
+
+
+class DecodeTests(unittest.TestCase):
+
+    def setUp(self):
+        quiet = contextlib.ExitStack()
+        quiet.enter_context(contextlib.redirect_stdout(io.StringIO()))
+        quiet.enter_context(contextlib.redirect_stderr(io.StringIO()))
+        self.addCleanup(quiet.close)
+
+    def test_decode_bytes_matches_decode(self):
+        for secret in SECRETS:
+            with self.subTest(secret=secret):
+                stego_bytes = invisi_text.encode_bytes(CARRIER_TEXT, secret)
+                self.assertEqual(invisi_text.decode_bytes(stego_bytes), secret)
+                self.assertEqual(invisi_text.decode_bytes(stego_bytes),
+                                 invisi_text.decode(stego_bytes.decode('utf-8')))
+        self.assertEqual(invisi_text.decode_bytes(b""), "")
+
+    @staticmethod
+    def _stego_text(bits):
+        # Hide a raw bit string the way the encoder does, one bit per word
+        bit_chars = {'0': invisi_text.ZERO_BIT, '1': invisi_text.ONE_BIT}
+        return ''.join(f"word {bit_chars[bit]} " for bit in bits) + "end"
+
+    def test_decode_stops_at_eot(self):
+        bits = invisi_text._message_to_binary("Hi" + invisi_text.EOT_CHAR + "junk")
+        self.assertEqual(invisi_text.decode(self._stego_text(bits)), "Hi")
+
+    def test_decode_drops_trailing_partial_byte(self):
+        bits = invisi_text._message_to_binary("Hi" + invisi_text.EOT_CHAR) + "101"
+        self.assertEqual(invisi_text.decode(self._stego_text(bits)), "Hi")
+
+    def test_decode_without_eot_keeps_all_complete_bytes(self):
+        bits = invisi_text._message_to_binary("Hi") + "0110"
+        self.assertEqual(invisi_text.decode(self._stego_text(bits)), "Hi")
+        self.assertEqual(invisi_text.decode(self._stego_text("0110")), "")
+
+
+if __name__ == '__main__':
+    unittest.main()